@@ -1,42 +1,101 @@
 from __future__ import annotations
 from abc import abstractmethod, ABC
-from typing import Any
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Sequence
 import random
 from typing import TypeVar, cast
+from functools import lru_cache
 from inspect import isabstract
+from itertools import chain
 import re
 import os
+import sys
+import json
 import numpy as np
 
 DIR = os.path.dirname(__file__)
 MAX_ITER = 100
+_TOKEN_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# single RNG instance shared by every generator in this process; seed via set_seed
+_rng = random.Random()
+
+def set_seed(seed: int) -> None:
+	_rng.seed(seed)
+	np.random.seed(seed)
+
+# state-word pairs indexed by a bool (False -> 0, True -> 1)
+_ON_OFF = ("off", "on")
+_OPEN_CLOSED = ("closed", "open")
+_OPENED_CLOSED = ("closed", "opened")
+_STARTED_STOPPED = ("stopped", "started")
+_YES_NO = ("No.", "Yes.")
+
+_T = TypeVar("_T")
+
+def _read_file(path: str) -> str:
+	with open(path) as f:
+		return f.read()
+
+def _write_file(path: str, data: str) -> None:
+	# each file's contents arrive fully built, so skip the text-IO buffer and
+	# issue a single write syscall
+	fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+	try:
+		os.write(fd, data.encode())
+	finally:
+		os.close(fd)
+
+@lru_cache(maxsize=None)
+def _load_lines(filename: str, lower: bool = False) -> tuple[str, ...]:
+	with open(os.path.join(DIR, filename)) as f:
+		text = f.read()
+	if lower:
+		text = text.lower()
+	return tuple(line for line in text.splitlines() if line)
+
+def _pop_random(pool: list[_T]) -> _T:
+	# swap the chosen element to the end so the pop is O(1) instead of shifting the tail
+	i = _rng.randrange(len(pool))
+	pool[i], pool[-1] = pool[-1], pool[i]
+	return pool.pop()
 
 class Predicate:
+	__slots__ = ("name", "parameter_list", "_str")
 	def __init__(self, name: str, parameter_list: list[str]) -> None:
 		self.name = name
 		self.parameter_list = parameter_list
-	
+		self._str: str | None = None
+
 	def __str__(self) -> str:
-		return "({} {})".format(self.name, " ".join(self.parameter_list))
+		if self._str is None:
+			self._str = "({} {})".format(self.name, " ".join(self.parameter_list))
+		return self._str
 
 class Action:
+	__slots__ = ("name", "parameter_list", "preconditions", "effects", "_str")
 	def __init__(self, name: str, parameter_list: list[str], preconditions: list[str], effects: list[str]) -> None:
 		self.name = name
 		self.parameter_list = parameter_list
 		self.preconditions = preconditions
 		self.effects = effects
-	
+		self._str: str | None = None
+
 	def __str__(self) -> str:
+		if self._str is not None:
+			return self._str
 		preconditions = "\t\t:precondition (and\n" \
 							+ "\t\t\t({})\n".format(")\n\t\t\t(".join(self.preconditions)) \
 						+ "\t\t)\n" if len(self.preconditions) > 0 else ""
-		return f"\t(:action {self.name}\n" \
+		self._str = f"\t(:action {self.name}\n" \
 					+ "\t\t:parameters ({})\n".format(" ".join(self.parameter_list)) \
 					+ preconditions \
 					+ "\t\t:effect (and\n" \
 					+ "\t\t\t({})\n".format(")\n\t\t\t(".join(self.effects)) \
 					+ "\t\t)\n" \
 					+ "\t)\n"
+		return self._str
 	
 class Goal:
 	def __init__(self, description: str, predicate_list: list[str]) -> None:
@@ -89,12 +148,20 @@ class Instance:
 		return yaml
 
 class RoomItem(ABC):
+	__slots__ = ("name", "article", "token_name", "entity_id")
 	def initialize_entity_id(self):
 		self.entity_id = EntityID(self.token_name, self.get_type_name())
 
+	def __init_subclass__(cls, **kwargs: Any) -> None:
+		super().__init_subclass__(**kwargs)
+		cls._type_name = cls.__name__.lower()
+
 	def __init__(self, name: str, token_name: str) -> None:
 		self.name = name
-		self.token_name = token_name
+		self.article = "an" if name[0] in "aeiou" else "a"
+		# token names recur as pieces of predicates, objects, and YAML entries;
+		# interning lets repeated lookups and comparisons share one string
+		self.token_name = sys.intern(token_name)
 		self.initialize_entity_id()
 
 	@abstractmethod
@@ -111,9 +178,22 @@ class RoomItem(ABC):
 	def get_pddl_domain_actions() -> list[Action]:
 		pass
 
+	_type_name = "roomitem"
+	_domain_pddl_cache: dict[type, tuple[list[Predicate], list[Action], list[str]]] = {}
+
 	@classmethod
 	def get_type_name(cls) -> str:
-		return cls.__name__.lower()
+		return cls._type_name
+
+	@classmethod
+	def get_domain_pddl(cls) -> tuple[list[Predicate], list[Action], list[str]]:
+		# the domain-level predicates, actions, and types are fixed per class;
+		# build them once and reuse across problem/domain dumps
+		cached = RoomItem._domain_pddl_cache.get(cls)
+		if cached is None:
+			cached = (cls.get_pddl_domain_predicates(), cls.get_pddl_domain_actions(), cls.get_required_types())
+			RoomItem._domain_pddl_cache[cls] = cached
+		return cached
 
 	@classmethod
 	def get_required_types(cls) -> list[str]:
@@ -127,7 +207,7 @@ class RoomItem(ABC):
 		return [self.token_name + " - " + self.get_type_name()]
 	
 	@staticmethod
-	def get_static_entities() -> list[Instance]:
+	def get_static_entities() -> Sequence[Instance]:
 		return []
 	
 	@abstractmethod
@@ -142,15 +222,16 @@ class RoomItem(ABC):
 		pass
 
 class Queryable:
+	__slots__ = ()
 	@abstractmethod
 	def generate_query_answer(self) -> tuple[str, str]:
 		pass
 
 class StationaryItem(RoomItem):
+	__slots__ = ("parent",)
 	def __init__(self, name: str, parent: Room) -> None:
-		suffix = re.sub(r"[^a-zA-Z0-9]+", "_", name).lower()
-		token_name = parent.token_name + "_" + suffix
-		super().__init__(name, token_name)
+		suffix = _TOKEN_RE.sub("_", name).lower()
+		super().__init__(name, f"{parent.token_name}_{suffix}")
 		self.parent = parent
 	
 	@staticmethod
@@ -172,6 +253,7 @@ class StationaryItem(RoomItem):
 		return []
 
 class MovableItem(RoomItem, Queryable):
+	__slots__ = ("shortened_name", "container", "relative_location", "extra_location_info")
 	def __init__(self, name: str, token_name: str, shortened_name: str, use_default_article: bool = True) -> None:
 		super().__init__(name, token_name)
 		self.set_shortened_name(shortened_name, use_default_article)
@@ -210,8 +292,8 @@ class MovableItem(RoomItem, Queryable):
 	
 	def get_yaml_attributes(self) -> list[Attribute]:
 		attributes = [Attribute(Person.IN_HAND_RELATION if isinstance(self.container, Person) else self.container.get_contains_relation(), self.container.entity_id)]
-		if "extra_attributes" in self.extra_location_info.keys():
-			extras = self.extra_location_info.get("extra_attributes")
+		extras = self.extra_location_info.get("extra_attributes")
+		if extras is not None:
 			assert isinstance(extras, list)
 			attributes += extras
 		return attributes
@@ -231,11 +313,11 @@ class MovableItem(RoomItem, Queryable):
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
 		usable_people = people.copy()
-		person = usable_people.pop(random.randrange(len(usable_people)))
+		person = _pop_random(usable_people)
 		while self in person.items:
 			if len(usable_people) == 0:
 				return None
-			person = usable_people.pop(random.randrange(len(usable_people)))
+			person = _pop_random(usable_people)
 		agent.parent = person.parent
 		self.exchange_container(person)
 		return Goal(
@@ -244,6 +326,7 @@ class MovableItem(RoomItem, Queryable):
 		)
 
 class AccompanyingItem(MovableItem):
+	__slots__ = ()
 	def __init__(self, name: str, token_name: str, shortened_name: str, use_default_article: bool = True) -> None:
 		super().__init__(name, token_name, shortened_name, use_default_article)
 	
@@ -251,6 +334,7 @@ class AccompanyingItem(MovableItem):
 		return None
 
 class Container(StationaryItem):
+	__slots__ = ("items",)
 	ITEM_PARAM = "?a"
 	CONTAINER_PARAM = "?b"
 	AGENT_PARAM = "?c"
@@ -266,19 +350,33 @@ class Container(StationaryItem):
 	def can_hold(item_type: type[MovableItem]) -> bool:
 		pass
 
+	_holdable_types: dict[type, list[type[MovableItem]]] = {}
+	_holdable_type_sets: dict[type, frozenset[type[MovableItem]]] = {}
+
 	@classmethod
 	def get_holdable_types(cls) -> list[type[MovableItem]]:
-		return [movable_type for movable_type in movable_types if cls.can_hold(movable_type)]
-	
+		holdable = Container._holdable_types.get(cls)
+		if holdable is None:
+			holdable = [movable_type for movable_type in movable_types if cls.can_hold(movable_type)]
+			Container._holdable_types[cls] = holdable
+		return holdable
+
+	@classmethod
+	def get_holdable_type_set(cls) -> frozenset[type[MovableItem]]:
+		# movable_types is fixed once built, so the answer per class never changes
+		type_set = Container._holdable_type_sets.get(cls)
+		if type_set is None:
+			type_set = frozenset(cls.get_holdable_types())
+			Container._holdable_type_sets[cls] = type_set
+		return type_set
+
 	def populate(self, items: list[MovableItem], max_allowed: int) -> None:
-		holdables = [item for item in items if self.can_hold(type(item))]
-		random.shuffle(holdables)
-		selected = 0
-		while len(holdables) > 0 and selected < max_allowed:
-			item = holdables.pop()
-			items.remove(item)
-			self.items.append(item)
-			selected += 1
+		holdable_set = self.get_holdable_type_set()
+		holdables = [item for item in items if type(item) in holdable_set]
+		chosen = _rng.sample(holdables, min(max_allowed, len(holdables)))
+		chosen_set = set(chosen)
+		items[:] = [item for item in items if item not in chosen_set]
+		self.items += chosen
 		for item in self.items:
 			item.container = self
 			item.relative_location, item.extra_location_info = self.generate_relative_location()
@@ -290,28 +388,24 @@ class Container(StationaryItem):
 	
 	@staticmethod
 	def get_item_list_description(item_list: list[MovableItem]) -> str:
-		description = ""
-		for i, item in enumerate(item_list):
-			description += "a{} {}".format("n" if item.name[0] in "aeiou" else "", item.name)
-			if len(item_list) == 2 and i == 0:
-				description += " and "
-			else:
-				if i < len(item_list) - 1 and (i != len(item_list) - 2 or len(item_list) > 2):
-					description += ", "
-				if i == len(item_list) - 2:
-					description += "and "
-		return description
+		parts = [f"{item.article} {item.name}" for item in item_list]
+		if len(parts) == 1:
+			return parts[0]
+		if len(parts) == 2:
+			return f"{parts[0]} and {parts[1]}"
+		return "{}, and {}".format(", ".join(parts[:-1]), parts[-1])
 	
 	@abstractmethod
 	def generate_relative_location(self) -> tuple[str, dict[Any, Any]]:
 		pass
 
 	def perform_action(self, people: list[Person]) -> str | None:
-		person = random.choice(people)
+		person = _rng.choice(people)
 		items = person.items.copy()
-		random.shuffle(items)
+		_rng.shuffle(items)
+		holdable_set = self.get_holdable_type_set()
 		for item in items:
-			if not self.can_hold(type(item)):
+			if type(item) not in holdable_set:
 				continue
 			person.parent = self.parent
 			item.exchange_container(self)
@@ -381,9 +475,10 @@ class Container(StationaryItem):
 		return [cls.get_place_action(), cls.get_remove_action()]
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		random.shuffle(all_items)
+		_rng.shuffle(all_items)
+		holdable_set = self.get_holdable_type_set()
 		for item in all_items:
-			if not self.can_hold(type(item)):
+			if type(item) not in holdable_set:
 				continue
 			agent.parent = self.parent
 			item.exchange_container(self)
@@ -394,6 +489,7 @@ class Container(StationaryItem):
 		return None
 
 class InteractableItem(RoomItem, Queryable):
+	__slots__ = ()
 	@abstractmethod
 	def get_special_init_conditions(self) -> list[str]:
 		pass
@@ -403,6 +499,7 @@ class InteractableItem(RoomItem, Queryable):
 		pass
 
 class StationaryInteractable(StationaryItem, InteractableItem):
+	__slots__ = ()
 	def get_init_conditions(self) -> list[str]:
 		return StationaryItem.get_init_conditions(self) + self.get_special_init_conditions()
 	
@@ -410,12 +507,13 @@ class StationaryInteractable(StationaryItem, InteractableItem):
 		return StationaryItem.get_yaml_attributes(self) + self.get_special_yaml_attributes()
 
 class MovableInteractable(MovableItem, InteractableItem):
+	__slots__ = ()
 	@abstractmethod
 	def generate_interactable_qa(self) -> tuple[str, str]:
 		pass
 
 	def generate_query_answer(self) -> tuple[str, str]:
-		return self.generate_interactable_qa() if random.choice([True, False]) else MovableItem.generate_query_answer(self)
+		return self.generate_interactable_qa() if _rng.getrandbits(1) else MovableItem.generate_query_answer(self)
 	
 	@abstractmethod
 	def interact(self, people: list[Person]) -> str | None:
@@ -432,11 +530,15 @@ class MovableInteractable(MovableItem, InteractableItem):
 		pass
 
 	def perform_action(self, people: list[Person]) -> str | None:
-		for _ in range(MAX_ITER):
-			action = self.interact(people) if random.choice([True, False]) else MovableItem.perform_action(self, people)
-			if action is not None:
-				return action
-		raise Exception("Unable to generate action")
+		if _rng.getrandbits(1):
+			action = self.interact(people)
+			if action is None:
+				action = MovableItem.perform_action(self, people)
+			return action
+		action = MovableItem.perform_action(self, people)
+		if action is None:
+			action = self.interact(people)
+		return action
 
 	def get_init_conditions(self) -> list[str]:
 		return MovableItem.get_init_conditions(self) + self.get_special_init_conditions()
@@ -445,23 +547,28 @@ class MovableInteractable(MovableItem, InteractableItem):
 		return MovableItem.get_yaml_attributes(self) + self.get_special_yaml_attributes()
 
 class InteractableContainer(Container, StationaryInteractable):
+	__slots__ = ()
 	@abstractmethod
 	def interact(self, people: list[Person]) -> str | None:
 		pass
 
 	def perform_action(self, people: list[Person]) -> str | None:
-		for _ in range(MAX_ITER):
-			action = self.interact(people) if random.choice([True, False]) else Container.perform_action(self, people)
-			if action is not None:
-				return action
-		raise Exception("Unable to generate action")
+		if _rng.getrandbits(1):
+			action = self.interact(people)
+			if action is None:
+				action = Container.perform_action(self, people)
+			return action
+		action = Container.perform_action(self, people)
+		if action is None:
+			action = self.interact(people)
+		return action
 	
 	@abstractmethod
 	def generate_interactable_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
 		pass
 
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		if random.choice([True, False]):
+		if _rng.getrandbits(1):
 			goal = self.generate_interactable_goal(people, all_items, agent)
 			if goal is None:
 				goal = Container.generate_goal(self, people, all_items, agent)
@@ -506,6 +613,7 @@ class InteractableContainer(Container, StationaryInteractable):
 		return super().get_pddl_domain_actions() + cls.get_special_domain_actions()
 
 class Table(Container):
+	__slots__ = ()
 	@staticmethod
 	def can_hold(item_type: type[MovableItem]) -> bool:
 		return True
@@ -518,6 +626,7 @@ class Table(Container):
 		return "on", {}
 	
 class Shelf(Container):
+	__slots__ = ("levels",)
 	MIN_LEVELS = 7
 	MAX_LEVELS = 15
 	LEVEL_PARAM = "?e"
@@ -525,12 +634,11 @@ class Shelf(Container):
 	EXTRA_INFO: dict[str, Any] = {"level_token" : LEVEL_PARAM}
 
 	@staticmethod
+	@lru_cache(maxsize=None)
 	def get_level_name(level: int) -> str:
 		return "shelf_level_" + str(level)
 	
-	LEVEL_OBJECTS: list[Instance] = []
-	for i in range(MAX_LEVELS):
-		LEVEL_OBJECTS.append(Instance(EntityID(get_level_name.__func__(i + 1), LEVEL_TYPE), []))
+	LEVEL_OBJECTS: tuple[Instance, ...]
 
 	def __init__(self, parent: Room, levels: int) -> None:
 		super().__init__("shelf", parent)
@@ -542,26 +650,24 @@ class Shelf(Container):
 	
 	@staticmethod
 	def generate_instance(parent: Room) -> tuple[Shelf, list[AccompanyingItem]]:
-		return Shelf(parent, random.randint(Shelf.MIN_LEVELS, Shelf.MAX_LEVELS)), []
+		return Shelf(parent, _rng.randint(Shelf.MIN_LEVELS, Shelf.MAX_LEVELS)), []
 	
 	def get_description(self) -> str:
-		items_by_level: dict[int, list[MovableItem]] = {level : [] for level in range(1, self.levels + 1)}
+		items_by_level: dict[int, list[MovableItem]] = defaultdict(list)
 		for item in self.items:
 			items_by_level[item.extra_location_info["level_num"]].append(item)
 		description = f"The shelf has {self.levels} levels. "
-		for level, item_list in items_by_level.items():
-			if len(item_list) == 0:
-				continue
-			description += f"The {Shelf.integer_to_ordinal(level)} level of the shelf has {Shelf.get_item_list_description(item_list)}. "
+		for level in sorted(items_by_level):
+			description += f"The {_ORDINALS[level - 1]} level of the shelf has {Shelf.get_item_list_description(items_by_level[level])}. "
 		return description
 	
 	def generate_relative_location(self) -> tuple[str, dict[Any, Any]]:
-		level = random.randrange(self.levels) + 1
-		return f"on the {Shelf.integer_to_ordinal(level)} level of", \
+		level = _rng.randrange(self.levels) + 1
+		return _LEVEL_LOCATIONS[level - 1], \
 				{
 					"level_num" : level,
 					"level_token": self.get_level_name(level),
-					"extra_attributes": [Attribute("on_shelf_level", Shelf.LEVEL_OBJECTS[level - 1].entity_id)]
+					"extra_attributes": [_LEVEL_ATTRIBUTES[level - 1]]
 				}
 
 	@staticmethod
@@ -619,10 +725,19 @@ class Shelf(Container):
 		return attributes
 	
 	@staticmethod
-	def get_static_entities() -> list[Instance]:
+	def get_static_entities() -> Sequence[Instance]:
 		return Shelf.LEVEL_OBJECTS
 
+Shelf.LEVEL_OBJECTS = tuple(Instance(EntityID(Shelf.get_level_name(i + 1), Shelf.LEVEL_TYPE), []) for i in range(Shelf.MAX_LEVELS))
+
+# per-level location strings and attributes, so placing an item on a shelf
+# reuses the formatted pieces instead of rebuilding them per placement
+_ORDINALS = tuple(Shelf.integer_to_ordinal(n) for n in range(1, Shelf.MAX_LEVELS + 1))
+_LEVEL_LOCATIONS = tuple(f"on the {ordinal} level of" for ordinal in _ORDINALS)
+_LEVEL_ATTRIBUTES = tuple(Attribute("on_shelf_level", level.entity_id) for level in Shelf.LEVEL_OBJECTS)
+
 class Fridge(Container):
+	__slots__ = ("foods",)
 	MIN_FOODS = 30
 	MAX_FOODS = 40
 	def __init__(self, name: str, parent: Room, foods: list[Food]) -> None:
@@ -640,14 +755,14 @@ class Fridge(Container):
 	def generate_instance(parent: Room) -> tuple[Fridge, list[Food]]:
 		foods: list[Food] = []
 		food_item = Food.generate_instance()
-		threshold = random.randint(Fridge.MIN_FOODS, Fridge.MAX_FOODS)
+		threshold = _rng.randint(Fridge.MIN_FOODS, Fridge.MAX_FOODS)
 		while food_item is not None and len(foods) < threshold:
 			foods.append(cast(Food, food_item))
 			food_item = Food.generate_instance()
 		return Fridge("fridge", parent, foods), foods
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		if random.choice([True, False]):
+		if _rng.getrandbits(1):
 			goal = super().generate_goal(people, all_items, agent)
 			if goal is not None:
 				return goal
@@ -663,6 +778,7 @@ class Fridge(Container):
 		)
 
 class Toilet(StationaryItem):
+	__slots__ = ()
 	@staticmethod
 	def generate_instance(parent: Room) -> tuple[Toilet, list[AccompanyingItem]]:
 		return Toilet("toilet", parent), []
@@ -685,6 +801,7 @@ class Toilet(StationaryItem):
 		return ""
 
 class Sink(StationaryInteractable):
+	__slots__ = ("faucet_on",)
 	FAUCET_ON_RELATION = "faucet_on"
 
 	def __init__(self, name: str, parent: Room, faucet_on: bool) -> None:
@@ -692,13 +809,13 @@ class Sink(StationaryInteractable):
 		self.faucet_on = faucet_on
 
 	def generate_query_answer(self) -> tuple[str, str]:
-		return f"Is the faucet of the {self.get_full_name_with_room()} on or off?", "The faucet is {}.".format("on" if self.faucet_on else "off")
+		return f"Is the faucet of the {self.get_full_name_with_room()} on or off?", "The faucet is {}.".format(_ON_OFF[self.faucet_on])
 	
 	def perform_action(self, people: list[Person]) -> str | None:
-		person = random.choice(people)
+		person = _rng.choice(people)
 		person.parent = self.parent
 		self.faucet_on = not self.faucet_on
-		return "{} went to {} and turned {} the faucet of the {}.".format(person.name, self.parent.name, "on" if self.faucet_on else "off", self.name)
+		return "{} went to {} and turned {} the faucet of the {}.".format(person.name, self.parent.name, _ON_OFF[self.faucet_on], self.name)
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -721,21 +838,22 @@ class Sink(StationaryInteractable):
 	
 	@staticmethod
 	def generate_instance(parent: Room) -> tuple[Sink, list[AccompanyingItem]]:
-		return Sink("sink", parent, random.choice([True, False])), []
+		return Sink("sink", parent, bool(_rng.getrandbits(1))), []
 	
 	def get_description(self) -> str:
-		return "The sink has a faucet that can be turned on and off. It is currently {}. ".format("on" if self.faucet_on else "off")
+		return "The sink has a faucet that can be turned on and off. It is currently {}. ".format(_ON_OFF[self.faucet_on])
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		self.faucet_on = random.choice([True, False])
+		self.faucet_on = bool(_rng.getrandbits(1))
 		pred = f"{Sink.FAUCET_ON_RELATION} {self.token_name}"
 		agent.parent = self.parent
 		return Goal(
-			"Make sure that the faucet of the {} is {}.".format(self.get_full_name_with_room(), "on" if self.faucet_on else "off"),
+			"Make sure that the faucet of the {} is {}.".format(self.get_full_name_with_room(), _ON_OFF[self.faucet_on]),
 			[pred if self.faucet_on else f"not ({pred})"]
 		)
 
 class KitchenSink(InteractableContainer):
+	__slots__ = ("faucet_on", "dishes")
 	MIN_DISHES = 7
 	MAX_DISHES = 10
 	def __init__(self, name: str, parent: Room, faucet_on: bool, dishes: list[Kitchenware | LiquidContainer]) -> None:
@@ -754,12 +872,12 @@ class KitchenSink(InteractableContainer):
 
 	def interact(self, people: list[Person]) -> str | None:
 		self.faucet_on = not self.faucet_on
-		person = random.choice(people)
+		person = _rng.choice(people)
 		person.parent = self.parent
-		return "{} went to {} and turned {} the faucet of the {}.".format(person.name, self.parent.name, "on" if self.faucet_on else "off", self.name)
+		return "{} went to {} and turned {} the faucet of the {}.".format(person.name, self.parent.name, _ON_OFF[self.faucet_on], self.name)
 	
 	def generate_query_answer(self) -> tuple[str, str]:
-		return f"Is the faucet of the {self.get_full_name_with_room()} on or off?", "The faucet is {}.".format("on" if self.faucet_on else "off")
+		return f"Is the faucet of the {self.get_full_name_with_room()} on or off?", "The faucet is {}.".format(_ON_OFF[self.faucet_on])
 
 	def get_special_init_conditions(self) -> list[str]:
 		special_conds = []
@@ -771,7 +889,7 @@ class KitchenSink(InteractableContainer):
 		return []
 	
 	def get_interactable_description(self) -> str:
-		return "The sink has a faucet that can be turned on and off. It is currently {}. ".format("on" if self.faucet_on else "off")
+		return "The sink has a faucet that can be turned on and off. It is currently {}. ".format(_ON_OFF[self.faucet_on])
 	
 	@staticmethod
 	def get_special_domain_predicates() -> list[Predicate]:
@@ -789,25 +907,25 @@ class KitchenSink(InteractableContainer):
 	def generate_instance(parent: Room) -> tuple[KitchenSink, list[Kitchenware | LiquidContainer]]:
 		dishes: list[Kitchenware | LiquidContainer] = []
 		dish = Kitchenware.generate_instance()
-		threshold = random.randint(KitchenSink.MIN_DISHES, KitchenSink.MAX_DISHES)
+		threshold = _rng.randint(KitchenSink.MIN_DISHES, KitchenSink.MAX_DISHES)
 		while dish is not None and len(dishes) < threshold:
 			dishes.append(cast(Kitchenware, dish))
 			dish = Kitchenware.generate_instance()
 		glass = LiquidContainer.generate_instance()
 		if glass is not None:
 			dishes.append(glass)
-		return KitchenSink("sink", parent, random.choice([True, False]), dishes), dishes
+		return KitchenSink("sink", parent, bool(_rng.getrandbits(1)), dishes), dishes
 	
 	def get_special_yaml_attributes(self) -> list[Attribute]:
 		return [Attribute(Sink.FAUCET_ON_RELATION, self.faucet_on)]
 	
 	def generate_interactable_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
 		# 1/3 regular Sink goal, 1/3 clean goal, 1/3 return goal
-		if random.choice([True, False, False]):
+		if _rng.choice([True, False, False]):
 			goal = Sink.generate_goal(self, people, all_items, agent) # type: ignore
 			if goal is not None:
 				return goal
-		clean_goal = random.choice([True, False])
+		clean_goal = bool(_rng.getrandbits(1))
 		predicates: list[str] = []
 		agent.parent = self.parent
 		for dish in self.dishes:
@@ -826,6 +944,7 @@ class KitchenSink(InteractableContainer):
 		)
 
 class Washer(Container):
+	__slots__ = ()
 	def __init__(self, name: str, parent: Room) -> None:
 		super().__init__(name, parent)
 	
@@ -852,6 +971,7 @@ class Washer(Container):
 		return actions
 
 class Dryer(Container):
+	__slots__ = ()
 	def __init__(self, name: str, parent: Room) -> None:
 		super().__init__(name, parent)
 	
@@ -878,6 +998,7 @@ class Dryer(Container):
 		return actions
 
 class LaundryBasket(Container):
+	__slots__ = ()
 	def __init__(self, name: str, parent: Room) -> None:
 		super().__init__(name, parent)
 	
@@ -893,23 +1014,22 @@ class LaundryBasket(Container):
 		return LaundryBasket("laundry basket", parent), []
 
 class Book(MovableItem):
-	with open(os.path.join(DIR, "book_titles.txt")) as f:
-		available_titles = f.read().splitlines()
+	__slots__ = ()
+	available_titles = list(_load_lines("book_titles.txt"))
 
 	def __init__(self, title: str) -> None:
-		prefix = re.sub(r"[^a-zA-Z0-9]+", "_", title).lower()
+		prefix = _TOKEN_RE.sub("_", title).lower()
 		super().__init__(f'book called "{title}"', prefix + "_book", f'"{title}" book')
 
 	@staticmethod
 	def generate_instance() -> Book | None:
 		if len(Book.available_titles) == 0:
 			return None
-		idx = random.randrange(len(Book.available_titles))
-		return Book(Book.available_titles.pop(idx))
+		return Book(_pop_random(Book.available_titles))
 
 class Pen(MovableItem):
-	with open(os.path.join(DIR, "colors.txt")) as f:	
-		available_colors = f.read().lower().splitlines()
+	__slots__ = ()
+	available_colors = list(_load_lines("colors.txt", lower=True))
 
 	def __init__(self, color: str) -> None:
 		super().__init__(f"{color} pen", color + "_pen", f"{color} pen")
@@ -918,12 +1038,12 @@ class Pen(MovableItem):
 	def generate_instance() -> Pen | None:
 		if len(Pen.available_colors) == 0:
 			return None
-		idx = random.randrange(len(Pen.available_colors))
-		return Pen(Pen.available_colors.pop(idx))
+		return Pen(_pop_random(Pen.available_colors))
 
 class Singleton(MovableItem):
+	__slots__ = ()
 	def __init__(self, name: str) -> None:
-		token_name = re.sub(r"[^a-zA-Z0-9]+", "_", name).lower()
+		token_name = _TOKEN_RE.sub("_", name).lower()
 		super().__init__(name, token_name, name)
 	
 	@staticmethod
@@ -936,17 +1056,18 @@ class Singleton(MovableItem):
 		names = cls.get_available_names()
 		if len(names) == 0:
 			return None
-		return cls(names.pop(random.randrange(len(names))))
+		return cls(_pop_random(names))
 
 class Food(Singleton, AccompanyingItem):
-	with open(os.path.join(DIR, "foods.txt")) as f:
-		available_foods = f.read().lower().splitlines()
+	__slots__ = ()
+	available_foods = list(_load_lines("foods.txt", lower=True))
 	
 	@staticmethod
 	def get_available_names() -> list[str]:
 		return Food.available_foods
 
 class Kitchenware(Singleton, AccompanyingItem):
+	__slots__ = ("clean", "sink")
 	available_kitchenware = ["plate", "bowl", "fork", "spoon", "knife", "frying pan", "pot", "ladle", "whisk"]
 
 	@staticmethod
@@ -959,39 +1080,40 @@ class Kitchenware(Singleton, AccompanyingItem):
 			return f"Something spilled on {self.shortened_name} so it got dirty."
 		else:
 			self.clean = True
-			person = random.choice(people)
+			person = _rng.choice(people)
 			person.parent = self.sink.parent
 			self.exchange_container(self.sink)
 			return f"{person.name} went to {person.parent.name} and washed {self.shortened_name} in the {self.sink.name}."
 	
 	def __init__(self, name: str) -> None:
 		super().__init__(name)
-		self.clean = random.choice([True, False])
+		self.clean = bool(_rng.getrandbits(1))
 		self.sink: KitchenSink
 	
 	def get_yaml_attributes(self) -> list[Attribute]:
 		return super().get_yaml_attributes() + [Attribute("dish_is_clean", self.clean)]
 
 class Window(StationaryInteractable):
+	__slots__ = ("open",)
 	def __init__(self, parent: Room, open: bool) -> None:
 		super().__init__("window", parent)
 		self.open = open
 	
 	def generate_query_answer(self) -> tuple[str, str]:
-		return f"Are the blinds of the {self.get_full_name_with_room()} open or closed?", "The window blinds are {}.".format("open" if self.open else "closed")
+		return f"Are the blinds of the {self.get_full_name_with_room()} open or closed?", "The window blinds are {}.".format(_OPEN_CLOSED[self.open])
 	
 	def perform_action(self, people: list[Person]) -> str | None:
 		self.open = not self.open
-		person = random.choice(people)
+		person = _rng.choice(people)
 		person.parent = self.parent
-		return "{} went to {} and {} the blinds of the {}.".format(person.name, self.parent.name, "opened" if self.open else "closed", self.name)
+		return "{} went to {} and {} the blinds of the {}.".format(person.name, self.parent.name, _OPENED_CLOSED[self.open], self.name)
 	
 	def get_description(self) -> str:
-		return "The window has blinds that can open and close. They are currently {}. ".format("open" if self.open else "closed")
+		return "The window has blinds that can open and close. They are currently {}. ".format(_OPEN_CLOSED[self.open])
 
 	@staticmethod
 	def generate_instance(parent: Room) -> tuple[Window, list[AccompanyingItem]]:
-		return Window(parent, random.choice([True, False])), []
+		return Window(parent, bool(_rng.getrandbits(1))), []
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1013,34 +1135,35 @@ class Window(StationaryInteractable):
 		return [Attribute("window_open", self.open)]
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		self.open = random.choice([True, False])
+		self.open = bool(_rng.getrandbits(1))
 		pred = f"window_open {self.token_name}"
 		agent.parent = self.parent
 		return Goal(
-			"Make sure the blinds of the {} are {}.".format(self.get_full_name_with_room(), "open" if self.open else "closed"),
+			"Make sure the blinds of the {} are {}.".format(self.get_full_name_with_room(), _OPEN_CLOSED[self.open]),
 			[pred if self.open else f"not ({pred})"]
 		)
 
 class Light(StationaryInteractable):
+	__slots__ = ("on",)
 	def __init__(self, name: str, parent: Room, on: bool) -> None:
 		super().__init__(name, parent)
 		self.on = on
 	
 	def generate_query_answer(self) -> tuple[str, str]:
-		return f"Is the {self.get_full_name_with_room()} on or off?", "The light is {}.".format("on" if self.on else "off")
+		return f"Is the {self.get_full_name_with_room()} on or off?", "The light is {}.".format(_ON_OFF[self.on])
 	
 	def perform_action(self, people: list[Person]) -> str | None:
 		self.on = not self.on
-		person = random.choice(people)
+		person = _rng.choice(people)
 		person.parent = self.parent
-		return "{} went to {} and turned {} the {}.".format(person.name, self.parent.name, "on" if self.on else "off", self.name)
+		return "{} went to {} and turned {} the {}.".format(person.name, self.parent.name, _ON_OFF[self.on], self.name)
 	
 	def get_description(self) -> str:
-		return "The light turns on and off. It is currently {}. ".format("on" if self.on else "off")
+		return "The light turns on and off. It is currently {}. ".format(_ON_OFF[self.on])
 	
 	@staticmethod
 	def generate_instance(parent: Room) -> tuple[Light, list[AccompanyingItem]]:
-		return Light("overhead light", parent, random.choice([True, False])), []
+		return Light("overhead light", parent, bool(_rng.getrandbits(1))), []
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1062,17 +1185,18 @@ class Light(StationaryInteractable):
 		return [Attribute("light_on", self.on)]
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		self.on = random.choice([True, False])
+		self.on = bool(_rng.getrandbits(1))
 		pred = f"light_on {self.token_name}"
 		agent.parent = self.parent
 		return Goal(
-			"Make sure the {} is {}.".format(self.get_full_name_with_room(), "on" if self.on else "off"),
+			"Make sure the {} is {}.".format(self.get_full_name_with_room(), _ON_OFF[self.on]),
 			[pred if self.on else f"not ({pred})"]
 		)
 
 class Remote(AccompanyingItem):
+	__slots__ = ()
 	def __init__(self, name: str) -> None:
-		token_name = re.sub(r"[^a-zA-Z0-9]+", "_", name).lower()
+		token_name = _TOKEN_RE.sub("_", name).lower()
 		super().__init__(name, token_name, name, True)
 
 	@staticmethod
@@ -1080,25 +1204,24 @@ class Remote(AccompanyingItem):
 		return Remote("remote")
 
 class Cloth(MovableInteractable):
-	with open(os.path.join(DIR, "clothes.txt")) as f:	
-		available_clothes = f.read().splitlines()
-	with open(os.path.join(DIR, "names.txt")) as f:	
-		available_names = f.read().splitlines()
+	__slots__ = ("clean",)
+	available_clothes = list(_load_lines("clothes.txt"))
+	available_names = list(_load_lines("names.txt"))
 	used_combos = set()
 
 	def __init__(self, type: str, owner: str, clean: bool) -> None:
-		type_token = re.sub(r"[^a-zA-Z0-9]+", "_", type).lower()
+		type_token = _TOKEN_RE.sub("_", type).lower()
 		super().__init__(f"{type} that belongs to {owner}", f"{owner.lower()}_{type_token}", f"{owner}'s {type}", False)
 		self.clean = clean
 	
 	@staticmethod
 	def generate_instance() -> Cloth | None:
 		for _ in range(MAX_ITER):
-			person = random.choice(Cloth.available_names)
-			cloth = random.choice(Cloth.available_clothes)
+			person = _rng.choice(Cloth.available_names)
+			cloth = _rng.choice(Cloth.available_clothes)
 			if (person, cloth) not in Cloth.used_combos:
 				Cloth.used_combos.add((person, cloth))
-				return Cloth(cloth, person, random.choice([True, False]))
+				return Cloth(cloth, person, bool(_rng.getrandbits(1)))
 		return None
 	
 	def get_special_init_conditions(self) -> list[str]:
@@ -1108,13 +1231,13 @@ class Cloth(MovableInteractable):
 		return conditions
 	
 	def generate_interactable_qa(self) -> tuple[str, str]:
-		return f"Is {self.shortened_name} clean?", "Yes." if self.clean else "No."
+		return f"Is {self.shortened_name} clean?", _YES_NO[self.clean]
 	
 	def interact(self, people: list[Person]) -> str | None:
 		if not self.clean:
 			return None
 		self.clean = False
-		return f"{random.choice(people).name} accidentally spilled something on {self.shortened_name} so now it's dirty."
+		return f"{_rng.choice(people).name} accidentally spilled something on {self.shortened_name} so now it's dirty."
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1131,11 +1254,13 @@ class Cloth(MovableInteractable):
 		return [Attribute("cloth_is_clean", self.clean), Attribute("cloth_is_dry", True)]
 
 class TV(StationaryInteractable):
+	__slots__ = ("on", "curr_channel", "remote")
 	class Channel:
+		__slots__ = ("name", "token_name", "entity_id")
 		TYPE_NAME = "channel"
 		def __init__(self, name: str) -> None:
 			self.name = name
-			self.token_name = re.sub(r"[^a-zA-Z0-9]+", "_", name).lower()
+			self.token_name = _TOKEN_RE.sub("_", name).lower()
 			self.entity_id = EntityID(self.token_name, "channel")
 
 	CHANNELS = [
@@ -1146,7 +1271,7 @@ class TV(StationaryInteractable):
 		Channel("Fox News"),
 		Channel("ESPN")
 	]
-	CHANNEL_OBJECTS = [Instance(channel.entity_id, []) for channel in CHANNELS]
+	CHANNEL_OBJECTS = tuple(Instance(channel.entity_id, []) for channel in CHANNELS)
 
 	def __init__(self, parent: Room, on: bool, curr_channel: Channel, remote: Remote) -> None:
 		super().__init__("TV", parent)
@@ -1160,7 +1285,7 @@ class TV(StationaryInteractable):
 	
 	def generate_query_answer(self) -> tuple[str, str]:
 		query = f"Is the TV in {self.parent.name} on or off? If it's on, what channel is it playing?"
-		answer = "The TV is {}{}.".format("on" if self.on else "off", f" and is playing {self.curr_channel.name}" if self.on else "")
+		answer = "The TV is {}{}.".format(_ON_OFF[self.on], f" and is playing {self.curr_channel.name}" if self.on else "")
 		return query, answer
 	
 	def perform_action(self, people: list[Person]) -> str | None:
@@ -1168,14 +1293,14 @@ class TV(StationaryInteractable):
 			return None
 		if self.on:
 			# keep the TV on
-			if random.choice([True, False]):
-				self.curr_channel = random.choice(TV.CHANNELS)
+			if _rng.getrandbits(1):
+				self.curr_channel = _rng.choice(TV.CHANNELS)
 				return f"{self.remote.container.name} switched the channel of the TV in {self.parent.name} to {self.curr_channel.name}."
 			# turn the TV off
 			self.on = False
 			return f"{self.remote.container.name} turned off the TV in {self.parent.name}."
 		self.on = True
-		self.curr_channel = random.choice(TV.CHANNELS)
+		self.curr_channel = _rng.choice(TV.CHANNELS)
 		return f"{self.remote.container.name} turned on the TV in {self.parent.name} and set it to {self.curr_channel.name}."
 	
 	def get_description(self) -> str:
@@ -1187,7 +1312,7 @@ class TV(StationaryInteractable):
 	def generate_instance(parent: Room) -> tuple[TV, list[AccompanyingItem]]:
 		remote = Remote.generate_instance()
 		assert remote is not None
-		return TV(parent, random.choice([True, False]), random.choice(TV.CHANNELS), remote), [remote]
+		return TV(parent, bool(_rng.getrandbits(1)), _rng.choice(TV.CHANNELS), remote), [remote]
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1213,7 +1338,7 @@ class TV(StationaryInteractable):
 		return []
 	
 	@staticmethod
-	def get_static_entities() -> list[Instance]:
+	def get_static_entities() -> Sequence[Instance]:
 		return TV.CHANNEL_OBJECTS
 	
 	def get_special_yaml_attributes(self) -> list[Attribute]:
@@ -1224,11 +1349,11 @@ class TV(StationaryInteractable):
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
 		usable_people = people.copy()
-		person = usable_people.pop(random.randrange(len(usable_people)))
+		person = _pop_random(usable_people)
 		while self.remote not in person.items:
 			if len(usable_people) == 0:
 				return None
-			person = usable_people.pop(random.randrange(len(usable_people)))
+			person = _pop_random(usable_people)
 		agent.parent = person.parent
 		self.remote.exchange_container(person)
 		return Goal(
@@ -1237,8 +1362,8 @@ class TV(StationaryInteractable):
 		)
 
 class Phone(MovableInteractable):
-	with open(os.path.join(DIR, "names.txt")) as f:	
-		available_names = f.read().splitlines()
+	__slots__ = ("ringing",)
+	available_names = list(_load_lines("names.txt"))
 
 	def __init__(self, owner: str) -> None:
 		super().__init__(f"phone that belongs to {owner}", owner.lower() + "_phone", f"{owner}'s phone", use_default_article=False)
@@ -1250,11 +1375,11 @@ class Phone(MovableInteractable):
 		return []
 	
 	def generate_interactable_qa(self) -> tuple[str, str]:
-		return f"Is {self.shortened_name} ringing?", "Yes." if self.ringing else "No."
+		return f"Is {self.shortened_name} ringing?", _YES_NO[self.ringing]
 	
 	def interact(self, people: list[Person]) -> str | None:
 		self.ringing = not self.ringing
-		return "{} {} ringing.".format(self.shortened_name, "started" if self.ringing else "stopped")
+		return "{} {} ringing.".format(self.shortened_name, _STARTED_STOPPED[self.ringing])
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1268,13 +1393,13 @@ class Phone(MovableInteractable):
 	def generate_instance() -> Phone | None:
 		if len(Phone.available_names) == 0:
 			return None
-		return Phone(Phone.available_names.pop(random.randrange(len(Phone.available_names))))
+		return Phone(_pop_random(Phone.available_names))
 	
 	def get_special_yaml_attributes(self) -> list[Attribute]:
 		return [Attribute("phone_ringing", self.ringing)]
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		if random.choice([True, False]):
+		if _rng.getrandbits(1):
 			goal = super().generate_goal(people, all_items, agent)
 			if goal is not None:
 				return goal
@@ -1284,20 +1409,19 @@ class Phone(MovableInteractable):
 		return None
 
 class LiquidContainer(MovableInteractable, AccompanyingItem):
+	__slots__ = ("empty", "liquid", "clean", "sink")
 	generated = False
 
-	LIQUIDS: list[Instance] = []
-	for l in ["water", "juice", "coffee", "soda"]:
-		LIQUIDS.append(Instance(EntityID(l, "liquid"), []))
+	LIQUIDS = tuple(Instance(EntityID(liquid, "liquid"), []) for liquid in ("water", "juice", "coffee", "soda"))
 	
 	def __init__(self) -> None:
 		super().__init__(f"glass", "glass", "the glass")
-		self.empty = random.choice([True, False])
+		self.empty = bool(_rng.getrandbits(1))
 		if self.empty:
 			self.liquid = None
-			self.clean = random.choice([True, False])
+			self.clean = bool(_rng.getrandbits(1))
 		else:
-			self.liquid = random.choice(LiquidContainer.LIQUIDS)
+			self.liquid = _rng.choice(LiquidContainer.LIQUIDS)
 			self.clean = False
 		self.sink: KitchenSink
 	
@@ -1315,17 +1439,17 @@ class LiquidContainer(MovableInteractable, AccompanyingItem):
 		return f"Is {self.shortened_name} empty? If not, what does it contain?", "It is empty." if self.empty else f"It is not empty. It contains {liquid}."
 	
 	def interact(self, people: list[Person]) -> str | None:
-		if random.choice([True, False]):
+		if _rng.getrandbits(1):
 			interaction = Kitchenware.perform_action(self, people) # type: ignore
 			if interaction is not None:
 				return interaction
 		if self.empty:
 			self.empty = False
-			self.liquid = random.choice(LiquidContainer.LIQUIDS)
-			return f"{random.choice(people).name} filled {self.shortened_name} with {self.liquid.entity_id.name}."
+			self.liquid = _rng.choice(LiquidContainer.LIQUIDS)
+			return f"{_rng.choice(people).name} filled {self.shortened_name} with {self.liquid.entity_id.name}."
 		self.empty = True
 		self.liquid = None
-		return f"{random.choice(people).name} emptied {self.shortened_name}."
+		return f"{_rng.choice(people).name} emptied {self.shortened_name}."
 	
 	@staticmethod
 	def get_pddl_domain_predicates() -> list[Predicate]:
@@ -1356,14 +1480,14 @@ class LiquidContainer(MovableInteractable, AccompanyingItem):
 		return attributes
 	
 	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		if random.choice([True, False]):
+		if _rng.getrandbits(1):
 			self.empty = True
 			self.liquid = None
 			return Goal("Make sure the glass is empty.", ["glass_empty " + self.token_name])
 		
 		self.empty = False
-		self.liquid = random.choice(LiquidContainer.LIQUIDS)
-		person = random.choice(people)
+		self.liquid = _rng.choice(LiquidContainer.LIQUIDS)
+		person = _rng.choice(people)
 		agent.parent = person.parent
 		self.exchange_container(person)
 		return Goal(
@@ -1372,7 +1496,7 @@ class LiquidContainer(MovableInteractable, AccompanyingItem):
 		)
 	
 	@staticmethod
-	def get_static_entities() -> list[Instance]:
+	def get_static_entities() -> Sequence[Instance]:
 		return LiquidContainer.LIQUIDS
 	
 	@classmethod
@@ -1380,12 +1504,12 @@ class LiquidContainer(MovableInteractable, AccompanyingItem):
 		return [f"{cls.get_type_name()} - {Kitchenware.get_type_name()}", "liquid"]
 
 class Person:
+	__slots__ = ("items", "name", "token_name", "entity_id", "parent")
 	TYPE_NAME = "person"
 	IN_HAND_RELATION = "in_person_hand"
 	IN_ROOM_RELATION = "person_in_room"
 
-	with open(os.path.join(DIR, "names.txt")) as f:	
-		available_names = f.read().splitlines()
+	available_names = list(_load_lines("names.txt"))
 	
 	def __init__(self, name: str, parent: Room) -> None:
 		self.items: list[MovableItem] = []
@@ -1398,13 +1522,15 @@ class Person:
 	def generate_person(rooms: list[Room]) -> Person | None:
 		if len(Person.available_names) == 0:
 			return None
-		return Person(Person.available_names.pop(random.randrange(len(Person.available_names))), random.choice(rooms))
+		return Person(_pop_random(Person.available_names), _rng.choice(rooms))
 	
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def get_in_hand_predicate(item_param: str, person_param: str) -> str:
 		return f"{Person.IN_HAND_RELATION} {item_param} {person_param}"
 	
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def get_in_room_predicate(person_param: str, room_param: str) -> str:
 		return f"{Person.IN_ROOM_RELATION} {person_param} {room_param}"
 	
@@ -1430,7 +1556,7 @@ class Person:
 	def perform_action(self, all_items: list[MovableItem]) -> str | None:
 		if len(self.items) >= 3:
 			return None
-		random.shuffle(all_items)
+		_rng.shuffle(all_items)
 		for item in all_items:
 			if item in self.items:
 				continue
@@ -1503,6 +1629,7 @@ def normalize_probabilities(p: list[float]) -> list[float]:
 	return [x / total for x in p]
 
 class Room(ABC):
+	__slots__ = ("name", "token_name", "entity_id", "items", "queryable_items", "yaml_instance", "item_freq")
 	ROOM_PARAM = "?a"
 	ITEM_PARAM = "?b"
 	TYPE_NAME = "room"
@@ -1548,44 +1675,38 @@ class Room(ABC):
 		return room, accompanying_items
 
 	def populate(self, movable_items: list[MovableItem]) -> None:
-		random.shuffle(self.items)
+		_rng.shuffle(self.items)
 		for item in self.items:
 			if isinstance(item, Container):
-				item.populate(movable_items, max_allowed=random.randint(3, 7))
+				item.populate(movable_items, max_allowed=_rng.randint(3, 7))
 	
 	def get_description(self) -> str:
 		room_description = ""
 		for i, item in enumerate(self.items):
-			room_description += "{}{} has a{} {}. ".format(self.name.capitalize(), "" if i == 0 else " also", "n" if item.name[0] in "aeiou" else "", item.name)
+			room_description += "{}{} has {} {}. ".format(self.name.capitalize(), "" if i == 0 else " also", item.article, item.name)
 			room_description += item.get_description()
 		return room_description
 	
 	def get_items_with_probabilities(self) -> tuple[list[StationaryItem], list[float]]:
-		return self.items.copy(), [1 / (self.item_freq.get(item, 0) + 1) / (Room.item_type_freq.get(type(item), 0) + 1) for item in self.items]
-	
-	def perform_action(self, people: list[Person]) -> str | None:
-		usable_items, probabilities = self.get_items_with_probabilities()
-		while len(usable_items) > 0:
-			probabilities = normalize_probabilities(probabilities)
-			idx = np.random.choice(np.arange(len(usable_items)), p=probabilities)
-			item = usable_items.pop(idx)
-			probabilities.pop(idx)
+		return self.items, [1 / (self.item_freq.get(item, 0) + 1) / (Room.item_type_freq.get(type(item), 0) + 1) for item in self.items]
 
+	def perform_action(self, people: list[Person]) -> str | None:
+		items, probabilities = self.get_items_with_probabilities()
+		order = np.random.choice(len(items), size=len(items), replace=False, p=normalize_probabilities(probabilities))
+		for idx in order:
+			item = items[idx]
 			action = item.perform_action(people)
 			if action is not None:
 				self.item_freq[item] = self.item_freq.get(item, 0) + 1
 				Room.item_type_freq[type(item)] = Room.item_type_freq.get(type(item), 0) + 1
 				return action
 		return None
-	
-	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
-		usable_items, probabilities = self.get_items_with_probabilities()
-		while len(usable_items) > 0:
-			probabilities = normalize_probabilities(probabilities)
-			idx = np.random.choice(np.arange(len(usable_items)), p=probabilities)
-			item = usable_items.pop(idx)
-			probabilities.pop(idx)
 
+	def generate_goal(self, people: list[Person], all_items: list[MovableItem], agent: Agent) -> Goal | None:
+		items, probabilities = self.get_items_with_probabilities()
+		order = np.random.choice(len(items), size=len(items), replace=False, p=normalize_probabilities(probabilities))
+		for idx in order:
+			item = items[idx]
 			goal = item.generate_goal(people, all_items, agent)
 			if goal is not None:
 				self.item_freq[item] = self.item_freq.get(item, 0) + 1
@@ -1594,18 +1715,25 @@ class Room(ABC):
 		return None
 	
 	def generate_query_answer(self) -> tuple[str, str]:
-		return random.choice(self.queryable_items).generate_query_answer()
+		return _rng.choice(self.queryable_items).generate_query_answer()
 	
 	@staticmethod
 	@abstractmethod
 	def can_hold(stationary_type: type[StationaryItem]) -> bool:
 		pass
 
+	_holdable_items: dict[type, list[type[StationaryItem]]] = {}
+
 	@classmethod
 	def get_holdable_items(cls) -> list[type[StationaryItem]]:
-		return [stationary_type for stationary_type in stationary_types if cls.can_hold(stationary_type)]
+		holdable = Room._holdable_items.get(cls)
+		if holdable is None:
+			holdable = [stationary_type for stationary_type in stationary_types if cls.can_hold(stationary_type)]
+			Room._holdable_items[cls] = holdable
+		return holdable
 	
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def get_in_room_predicate(room_param: str, item_param: str) -> str:
 		return f"{Room.IN_ROOM_RELATION} {room_param} {item_param}"
 	
@@ -1614,16 +1742,21 @@ class Room(ABC):
 		holdable_types = [item_type.get_type_name() for item_type in stationary_types]
 		return [Predicate(Room.IN_ROOM_RELATION, [Room.ROOM_PARAM + " - " + Room.TYPE_NAME, "{} - (either {})".format(Room.ITEM_PARAM, " ".join(holdable_types))])]
 	
+	def append_init_conditions(self, out: list[str]) -> None:
+		out.extend(chain.from_iterable(item.get_init_conditions() for item in self.items))
+
 	def get_init_conditions(self) -> list[str]:
 		init_conditions: list[str] = []
-		for item in self.items:
-			init_conditions += item.get_init_conditions()
+		self.append_init_conditions(init_conditions)
 		return init_conditions
-	
+
+	def append_pddl_objects(self, out: list[str]) -> None:
+		out.append(self.token_name + " - " + Room.TYPE_NAME)
+		out.extend(chain.from_iterable(item.get_pddl_objects() for item in self.items))
+
 	def get_pddl_objects(self) -> list[str]:
-		objects: list[str] = [self.token_name + " - " + Room.TYPE_NAME]
-		for item in self.items:
-			objects += item.get_pddl_objects()
+		objects: list[str] = []
+		self.append_pddl_objects(objects)
 		return objects
 	
 	def get_knowledge_yaml(self, indent: int) -> str:
@@ -1633,6 +1766,7 @@ class Room(ABC):
 		return yaml
 
 class Kitchen(Room):
+	__slots__ = ()
 	generated = False
 	@staticmethod
 	def generate_empty() -> Kitchen | None:
@@ -1646,6 +1780,7 @@ class Kitchen(Room):
 		return stationary_type in [Fridge, KitchenSink, Light]
 
 class LivingRoom(Room):
+	__slots__ = ()
 	generated = False
 	@staticmethod
 	def generate_empty() -> LivingRoom | None:
@@ -1659,14 +1794,14 @@ class LivingRoom(Room):
 		return stationary_type in [Window, Table, TV, Shelf, Light]
 
 class Bedroom(Room):
-	with open(os.path.join(DIR, "names.txt")) as f:	
-		available_names = f.read().splitlines()
+	__slots__ = ()
+	available_names = list(_load_lines("names.txt"))
 	
 	@staticmethod
 	def generate_empty() -> Bedroom | None:
 		if len(Bedroom.available_names) == 0:
 			return None
-		name = Bedroom.available_names.pop(random.randrange(len(Bedroom.available_names)))
+		name = _pop_random(Bedroom.available_names)
 		return Bedroom(f"{name}'s bedroom", f"{name.lower()}_bedroom")
 	
 	@staticmethod
@@ -1674,6 +1809,7 @@ class Bedroom(Room):
 		return stationary_type in [Window, Table, TV, Shelf, Light]
 
 class LaundryRoom(Room):
+	__slots__ = ()
 	generated = False
 
 	@staticmethod
@@ -1688,6 +1824,7 @@ class LaundryRoom(Room):
 		return stationary_type in [Light, Washer, Dryer, LaundryBasket]
 
 class Bathroom(Room):
+	__slots__ = ()
 	generated = False
 
 	@staticmethod
@@ -1704,6 +1841,7 @@ class Bathroom(Room):
 room_types: list[type[Room]]
 
 class Agent:
+	__slots__ = ("token_name", "entity_id", "parent")
 	TYPE_NAME = "agent"
 	IN_HAND_RELATION = "in_agent_hand"
 	IN_ROOM_RELATION = "agent_in_room"
@@ -1715,13 +1853,15 @@ class Agent:
 	
 	@staticmethod
 	def generate_agent(rooms: list[Room]) -> Agent:
-		return Agent(random.choice(rooms))
+		return Agent(_rng.choice(rooms))
 
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def get_in_hand_predicate(item_param: str, agent_param: str) -> str:
 		return f"{Agent.IN_HAND_RELATION} {item_param} {agent_param}"
 	
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def get_in_room_predicate(agent_param: str, room_param: str) -> str:
 		return f"{Agent.IN_ROOM_RELATION} {agent_param} {room_param}"
 	
@@ -1776,21 +1916,29 @@ class Agent:
 		return f"The agent is in {self.parent.name}. "
 
 class DatasetGenerator:
-	MAX_ROOMS = random.randint(30, 40)
-	MAX_ITEMS = random.randint(140, 160)
-	MAX_PEOPLE = random.randint(20, 30)
+	MAX_ROOMS = _rng.randint(30, 40)
+	MAX_ITEMS = _rng.randint(140, 160)
+	MAX_PEOPLE = _rng.randint(20, 30)
 
 	def __init__(self, parent_dir: str, num_state_changes: int = 100, state_changes_per_query: int = 10, state_changes_per_goal: int = 20) -> None:
+		_ensure_types()
 		self.num_state_changes = num_state_changes
 		self.state_changes_per_query = state_changes_per_query
 		self.state_changes_per_goal = state_changes_per_goal
 		self.parent_dir = parent_dir
 		self.rooms: list[Room] = []
 		self.people: list[Person] = []
-		self.description = ""
+		self._description_parts: list[str] = []
 		self.item_type_freq: dict[type[MovableItem], int] = {}
 		self.item_freq: dict[MovableItem, int] = {}
 
+		self._all_items_scratch: list[MovableItem] = []
+		self._all_stationary_scratch: list[StationaryItem] = []
+		self._usable_rooms_scratch: list[Room] = []
+		self._usable_movables_scratch: list[MovableItem] = []
+		self._usable_people_scratch: list[Person] = []
+		self._usable_collectives_scratch: list[type[CollectiveGoal]] = []
+
 		self.movable_items: list[MovableItem] = []
 		for movable_type in creatable_movable_types:
 			count = 0
@@ -1800,7 +1948,7 @@ class DatasetGenerator:
 					break
 				self.movable_items.append(item)
 				count += 1
-		random.shuffle(self.movable_items)
+		_rng.shuffle(self.movable_items)
 		
 		self.stationary_items: list[StationaryItem] = []
 		for room_type in room_types:
@@ -1824,28 +1972,34 @@ class DatasetGenerator:
 		
 		remaining_movables = self.movable_items.copy()
 		while remaining_movables:
-			random.shuffle(self.rooms)
+			_rng.shuffle(self.rooms)
 			for room in self.rooms:
 				room.populate(remaining_movables)
 		for room in self.rooms:
-			self.description += room.get_description() + "\n\n"
-		for person in self.people:
-			self.description += person.get_description()
-		self.description += self.agent.get_description()
+			self._description_parts.append(room.get_description())
+		self._description_parts.append("".join(person.get_description() for person in self.people) + self.agent.get_description())
+
+	@property
+	def description(self) -> str:
+		return "\n\n".join(self._description_parts)
 
 	def get_items_and_probabilities(self) -> tuple[list[MovableItem], list[float]]:
-		return self.movable_items.copy(), [1 / (self.item_freq.get(item, 0) + 1) / (self.item_type_freq.get(type(item), 0) + 1) for item in self.movable_items]
-	
+		return self.movable_items, [1 / (self.item_freq.get(item, 0) + 1) / (self.item_type_freq.get(type(item), 0) + 1) for item in self.movable_items]
+
 	def generate_state_change(self) -> str:
-		all_items = self.movable_items.copy()
-		usable_rooms = self.rooms.copy()
-		usable_movables, movable_probabilities = self.get_items_and_probabilities()
-		usable_people = self.people.copy()
+		all_items = self._all_items_scratch
+		all_items[:] = self.movable_items
+		usable_rooms = self._usable_rooms_scratch
+		usable_rooms[:] = self.rooms
+		usable_movables = self._usable_movables_scratch
+		usable_movables[:], movable_probabilities = self.get_items_and_probabilities()
+		usable_people = self._usable_people_scratch
+		usable_people[:] = self.people
 		for _ in range(MAX_ITER):
 			assert len(usable_rooms) > 0 or len(usable_movables) > 0 or len(usable_people) > 0
-			choice = random.randrange(5)
+			choice = _rng.randrange(5)
 			if len(usable_rooms) > 0 and choice <= 2:
-				action = usable_rooms.pop(random.randrange(len(usable_rooms))).perform_action(self.people)
+				action = _pop_random(usable_rooms).perform_action(self.people)
 				if action is not None:
 					return action
 			elif len(usable_movables) > 0 and choice == 3:
@@ -1859,27 +2013,33 @@ class DatasetGenerator:
 					self.item_type_freq[type(item)] = self.item_type_freq.get(type(item), 0) + 1
 					return action
 			elif len(usable_people) > 0:
-				action = usable_people.pop(random.randrange(len(usable_people))).perform_action(all_items)
+				action = _pop_random(usable_people).perform_action(all_items)
 				if action is not None:
 					return action
 		raise Exception("Unable to generate state change")
 	
 	def generate_goal(self) -> Goal:
-		all_items = self.movable_items.copy()
-		all_stationary = self.stationary_items.copy()
-		usable_rooms = self.rooms.copy()
-		usable_movables, movable_probabilities = self.get_items_and_probabilities()
-		usable_people = self.people.copy()
-		usable_collectives = collective_goal_types.copy()
+		all_items = self._all_items_scratch
+		all_items[:] = self.movable_items
+		all_stationary = self._all_stationary_scratch
+		all_stationary[:] = self.stationary_items
+		usable_rooms = self._usable_rooms_scratch
+		usable_rooms[:] = self.rooms
+		usable_movables = self._usable_movables_scratch
+		usable_movables[:], movable_probabilities = self.get_items_and_probabilities()
+		usable_people = self._usable_people_scratch
+		usable_people[:] = self.people
+		usable_collectives = self._usable_collectives_scratch
+		usable_collectives[:] = collective_goal_types
 		for _ in range(MAX_ITER):
 			assert len(usable_rooms) > 0 or len(usable_movables) > 0 or len(usable_people) > 0
-			choice = random.randrange(8)
+			choice = _rng.randrange(8)
 			if len(usable_rooms) > 0 and choice <= 2:
-				goal = usable_rooms.pop(random.randrange(len(usable_rooms))).generate_goal(self.people, all_items, self.agent)
+				goal = _pop_random(usable_rooms).generate_goal(self.people, all_items, self.agent)
 				if goal is not None:
 					return goal
 			elif len(usable_collectives) > 0 and choice <= 5:
-				goal = usable_collectives.pop(random.randrange(len(usable_collectives))).generate_goal(all_items, all_stationary, self.agent)
+				goal = _pop_random(usable_collectives).generate_goal(all_items, all_stationary, self.agent)
 				if goal is not None:
 					return goal
 			elif len(usable_movables) > 0 and choice == 6:
@@ -1893,74 +2053,87 @@ class DatasetGenerator:
 					self.item_type_freq[type(item)] = self.item_type_freq.get(type(item), 0) + 1
 					return goal
 			elif len(usable_people) > 0:
-				goal = usable_people.pop(random.randrange(len(usable_people))).generate_goal(all_items, self.agent)
+				goal = _pop_random(usable_people).generate_goal(all_items, self.agent)
 				if goal is not None:
 					return goal
 		raise Exception("Unable to generate goal")
 	
 	def generate_query_answer(self) -> tuple[str, str]:
-		if random.choice([True, False]):
-			return random.choice(self.movable_items).generate_query_answer()
-		return random.choice(self.rooms).generate_query_answer()
+		if _rng.getrandbits(1):
+			return _rng.choice(self.movable_items).generate_query_answer()
+		return _rng.choice(self.rooms).generate_query_answer()
 	
 	def run(self) -> None:
 		os.makedirs(self.parent_dir, exist_ok=True)
-		with open(os.path.join(self.parent_dir, "initial_state.txt"), "w") as f:
-			f.write(self.description)
-		predicate_names, domain_pddl = self.generate_domain_pddl()
-		with open(os.path.join(self.parent_dir, "predicate_names.txt"), "w") as f:
-			f.write("\n".join(predicate_names))
-		with open(os.path.join(self.parent_dir, "domain.pddl"), "w") as f:
-			f.write(domain_pddl)
-		with open(os.path.join(self.parent_dir, "problem.pddl"), "w") as f:
-			f.write(self.generate_problem_pddl())
-		with open(os.path.join(self.parent_dir, "knowledge.yaml"), "w") as f:
-			f.write(self.generate_knowledge_yaml())
-		
-		time_step = 0
-		for i in range(self.num_state_changes):
-			curr_dir = os.path.join(self.parent_dir, f"time_{time_step:04d}_state_change")
-			os.makedirs(curr_dir, exist_ok=True)
-			with open(os.path.join(curr_dir, "state_change.txt"), "w") as f:
-				f.write(self.generate_state_change())
-			with open(os.path.join(curr_dir, "problem.pddl"), "w") as f:
-				f.write(self.generate_problem_pddl())
-			with open(os.path.join(curr_dir, "knowledge.yaml"), "w") as f:
-				f.write(self.generate_knowledge_yaml())
-			time_step += 1
-			if (i + 1) % self.state_changes_per_query == 0:
-				curr_dir = os.path.join(self.parent_dir, f"time_{time_step:04d}_query")
-				os.makedirs(curr_dir, exist_ok=True)
-				query, true_answer = self.generate_query_answer()
-				with open(os.path.join(curr_dir, "query.txt"), "w") as f:
-					f.write(query)
-				with open(os.path.join(curr_dir, "answer.txt"), "w") as f:
-					f.write(true_answer)
-				time_step += 1
-			if (i + 1) % self.state_changes_per_goal == 0:
-				curr_dir = os.path.join(self.parent_dir, f"time_{time_step:04d}_goal")
+		# the serialized artifacts are independent of each other once generated,
+		# so hand the small-file writes to a thread pool instead of paying each
+		# open/write/close round trip on the generation thread
+		futures: list[Future[None]] = []
+		timeline: list[str] = []
+		with ThreadPoolExecutor(max_workers=8) as executor:
+			def write(path: str, data: str) -> None:
+				futures.append(executor.submit(_write_file, path, data))
+
+			write(os.path.join(self.parent_dir, "initial_state.txt"), self.description)
+			predicate_names, domain_pddl = self.generate_domain_pddl()
+			write(os.path.join(self.parent_dir, "predicate_names.txt"), "\n".join(predicate_names))
+			write(os.path.join(self.parent_dir, "domain.pddl"), domain_pddl)
+			write(os.path.join(self.parent_dir, "problem.pddl"), self.generate_problem_pddl())
+			write(os.path.join(self.parent_dir, "knowledge.yaml"), self.generate_knowledge_yaml())
+
+			# os.path.join normalizes its arguments on every call; the per-step
+			# paths are built thousands of times, so concatenate onto a cached
+			# prefix instead
+			parent_dir_sep = self.parent_dir + os.sep
+			time_step = 0
+			for i in range(self.num_state_changes):
+				curr_dir = f"{parent_dir_sep}time_{time_step:04d}_state_change"
 				os.makedirs(curr_dir, exist_ok=True)
-				problem_pddl = self.generate_problem_pddl(with_goal=True)
-				goal = self.generate_goal()
-				with open(os.path.join(curr_dir, "goal.txt"), "w") as f:
-					f.write(goal.description)
-				with open(os.path.join(curr_dir, "problem.pddl"), "w") as f:
-					f.write(problem_pddl.format(str(goal)))
-				with open(os.path.join(curr_dir, "knowledge.yaml"), "w") as f:
-					f.write(self.generate_knowledge_yaml())
+				state_change = self.generate_state_change()
+				problem_pddl = self.generate_problem_pddl()
+				knowledge_yaml = self.generate_knowledge_yaml()
+				write(curr_dir + os.sep + "state_change.txt", state_change)
+				write(curr_dir + os.sep + "problem.pddl", problem_pddl)
+				write(curr_dir + os.sep + "knowledge.yaml", knowledge_yaml)
+				timeline.append(json.dumps({"type": "state_change", "state_change": state_change, "problem_pddl": problem_pddl, "knowledge_yaml": knowledge_yaml}))
 				time_step += 1
-	
-	@staticmethod
+				if (i + 1) % self.state_changes_per_query == 0:
+					curr_dir = f"{parent_dir_sep}time_{time_step:04d}_query"
+					os.makedirs(curr_dir, exist_ok=True)
+					query, true_answer = self.generate_query_answer()
+					write(curr_dir + os.sep + "query.txt", query)
+					write(curr_dir + os.sep + "answer.txt", true_answer)
+					timeline.append(json.dumps({"type": "query", "query": query, "answer": true_answer}))
+					time_step += 1
+				if (i + 1) % self.state_changes_per_goal == 0:
+					curr_dir = f"{parent_dir_sep}time_{time_step:04d}_goal"
+					os.makedirs(curr_dir, exist_ok=True)
+					problem_pddl = self.generate_problem_pddl(with_goal=True)
+					goal = self.generate_goal()
+					knowledge_yaml = self.generate_knowledge_yaml()
+					write(curr_dir + os.sep + "goal.txt", goal.description)
+					write(curr_dir + os.sep + "problem.pddl", problem_pddl.format(str(goal)))
+					write(curr_dir + os.sep + "knowledge.yaml", knowledge_yaml)
+					timeline.append(json.dumps({"type": "goal", "goal": goal.description, "problem_pddl": problem_pddl.format(str(goal)), "knowledge_yaml": knowledge_yaml}))
+					time_step += 1
+			write(os.path.join(self.parent_dir, "timeline.jsonl"), "\n".join(timeline))
+		for future in futures:
+			future.result()
+
+	@staticmethod
+	@lru_cache(maxsize=None)
 	def generate_domain_pddl() -> tuple[list[str], str]:
+		_ensure_types()
 		predicates: list[Predicate] = Person.get_pddl_domain_predicates() + Room.get_pddl_domain_predicates()
 		actions: list[Action] = []
 		required_types: list[str] = [Person.TYPE_NAME, Room.TYPE_NAME, Agent.TYPE_NAME]
 		for item_type in item_types:
-			predicates += item_type.get_pddl_domain_predicates()
-			actions += item_type.get_pddl_domain_actions()
-			required_types += item_type.get_required_types()
+			type_predicates, type_actions, type_required_types = item_type.get_domain_pddl()
+			predicates += type_predicates
+			actions += type_actions
+			required_types += type_required_types
 		
-		required_types = sorted(required_types, key=len)
+		required_types = sorted(dict.fromkeys(required_types), key=len)
 
 		predicates += Agent.get_pddl_domain_predicates()
 		actions += Agent.get_pddl_domain_actions()
@@ -1970,50 +2143,47 @@ class DatasetGenerator:
 		formatted_predicates = [str(predicate) for predicate in predicates]
 		formatted_actions = [str(action) for action in actions]
 
-		return predicate_names, \
-				"(define (domain simulation)\n" \
-					+ "\t(:requirements :typing :negative-preconditions)\n" \
-					+ "\t(:types\n" \
-						+ "\t\t{}\n".format("\n\t\t".join(required_types)) \
-					+ "\t)\n" \
-					+ "\t(:predicates\n" \
-						+ "\t\t{}\n".format("\n\t\t".join(formatted_predicates)) \
-					+ "\t)\n\n" \
-					+ "{}".format("\n".join(formatted_actions)) \
-				+ ")\n"
+		parts = [
+			"(define (domain simulation)",
+			"\t(:requirements :typing :negative-preconditions)",
+			"\t(:types",
+		]
+		parts.extend("\t\t" + required_type for required_type in required_types)
+		parts.extend(("\t)", "\t(:predicates"))
+		parts.extend("\t\t" + formatted_predicate for formatted_predicate in formatted_predicates)
+		parts.extend(("\t)", "", "{})".format("\n".join(formatted_actions))))
+		return predicate_names, "\n".join(parts) + "\n"
 	
 	def generate_problem_pddl(self, with_goal: bool = False) -> str:
 		objects: list[str] = []
 		init_conditions: list[str] = []
 
-		objects += self.agent.get_pddl_objects()
-		init_conditions += self.agent.get_init_conditions()
+		objects.extend(self.agent.get_pddl_objects())
+		init_conditions.extend(self.agent.get_init_conditions())
 
-		for person in self.people:
-			objects += person.get_pddl_objects()
-			init_conditions += person.get_init_conditions()
+		objects.extend(chain.from_iterable(person.get_pddl_objects() for person in self.people))
+		init_conditions.extend(chain.from_iterable(person.get_init_conditions() for person in self.people))
 
 		for room in self.rooms:
-			objects += room.get_pddl_objects()
-			init_conditions += room.get_init_conditions()
-		
-		for item in self.movable_items:
-			objects += item.get_pddl_objects()
-			init_conditions += item.get_init_conditions()
+			room.append_pddl_objects(objects)
+			room.append_init_conditions(init_conditions)
+
+		objects.extend(chain.from_iterable(item.get_pddl_objects() for item in self.movable_items))
+		init_conditions.extend(chain.from_iterable(item.get_init_conditions() for item in self.movable_items))
 		
-		for entity in static_entities:
-			objects.append(f"{entity.entity_id.name} - {entity.entity_id.concept}")
+		objects.extend(_static_pddl_objects)
 		
-		return "(define (problem simulation-a)\n" \
-					+ "\t(:domain simulation)\n" \
-					+ "\t(:objects\n" \
-						+ "\t\t{}\n".format("\n\t\t".join(objects)) \
-					+ "\t)\n" \
-					+ "\t(:init\n" \
-						+ "\t\t({})\n".format(")\n\t\t(".join(init_conditions)) \
-					+ "\t)\n" \
-					+ ("{}" if with_goal else "") \
-				+ ")\n"
+		parts = [
+			"(define (problem simulation-a)",
+			"\t(:domain simulation)",
+			"\t(:objects",
+		]
+		parts.extend("\t\t" + pddl_object for pddl_object in objects)
+		parts.extend(("\t)", "\t(:init"))
+		parts.extend(f"\t\t({init_condition})" for init_condition in init_conditions)
+		parts.append("\t)")
+		parts.append("{})" if with_goal else ")")
+		return "\n".join(parts) + "\n"
 	
 	def generate_knowledge_yaml(self) -> str:
 		yaml = "version: 1\nentities:\n"
@@ -2033,60 +2203,68 @@ class Dataset:
 	def __init__(self, parent_dir: str) -> None:
 		self.domain_path = os.path.join(parent_dir, "domain.pddl")
 		self.initial_knowledge_path = os.path.join(parent_dir, "knowledge.yaml")
-		with open(os.path.join(parent_dir, "initial_state.txt")) as f:
-			self.initial_state = f.read()
-		with open(os.path.join(parent_dir, "predicate_names.txt")) as f:
-			self.predicate_names = f.read().splitlines()
-		with open(self.domain_path) as f:
-			self.domain_pddl = f.read()
-		with open(os.path.join(parent_dir, "problem.pddl")) as f:
-			self.initial_problem_pddl = f.read()
-		with open(self.initial_knowledge_path) as f:
-			self.initial_knowledge_yaml = f.read()
-		
-		time_steps = os.listdir(parent_dir)
-		time_steps.remove("initial_state.txt")
-		time_steps.remove("predicate_names.txt")
-		time_steps.remove("domain.pddl")
-		time_steps.remove("problem.pddl")
-		time_steps.remove("knowledge.yaml")
-		time_steps.sort()
+		self.initial_state = _read_file(os.path.join(parent_dir, "initial_state.txt"))
+		self.predicate_names = _read_file(os.path.join(parent_dir, "predicate_names.txt")).splitlines()
+		self.domain_pddl = _read_file(self.domain_path)
+		self.initial_problem_pddl = _read_file(os.path.join(parent_dir, "problem.pddl"))
+		self.initial_knowledge_yaml = _read_file(self.initial_knowledge_path)
 
-		self.num_time_steps = len(time_steps)
 		self.time_steps: list[dict[str, Any]] = []
 
-		for i, time_step in enumerate(time_steps):
-			curr_dir = os.path.join(parent_dir, time_step)
-			curr_data: dict[str, Any] = {"time" : i}
-			if time_step.endswith("query"):
-				curr_data["type"] = "query"
-				with open(os.path.join(curr_dir, "query.txt")) as f:
-					curr_data["query"] = f.read()
-				with open(os.path.join(curr_dir, "answer.txt")) as f:
-					curr_data["answer"] = f.read()
-			elif time_step.endswith("state_change"):
-				curr_data["type"] = "state_change"
-				with open(os.path.join(curr_dir, "state_change.txt")) as f:
-					curr_data["state_change"] = f.read()
-				curr_data["problem_path"] = os.path.join(curr_dir, "problem.pddl")
-				with open(curr_data["problem_path"]) as f:
-					curr_data["problem_pddl"] = f.read()
-				curr_data["knowledge_path"] = os.path.join(curr_dir, "knowledge.yaml")
-				with open(curr_data["knowledge_path"]) as f:
-					curr_data["knowledge_yaml"] = f.read()
-			elif time_step.endswith("goal"):
-				curr_data["type"] = "goal"
-				with open(os.path.join(curr_dir, "goal.txt")) as f:
-					curr_data["goal"] = f.read()
-				curr_data["problem_path"] = os.path.join(curr_dir, "problem.pddl")
-				with open(curr_data["problem_path"]) as f:
-					curr_data["problem_pddl"] = f.read()
-				curr_data["knowledge_path"] = os.path.join(curr_dir, "knowledge.yaml")
-				with open(curr_data["knowledge_path"]) as f:
-					curr_data["knowledge_yaml"] = f.read()
-			else:
-				raise Exception("Invalid dataset directory:", time_step)
-			self.time_steps.append(curr_data)
+		# the generator aggregates every per-step artifact into timeline.jsonl;
+		# prefer the single sequential read over opening 2-3 files per time step
+		parent_dir_sep = parent_dir + os.sep
+		timeline_path = parent_dir_sep + "timeline.jsonl"
+		if os.path.exists(timeline_path):
+			for i, line in enumerate(_read_file(timeline_path).splitlines()):
+				curr_data = {"time": i, **json.loads(line)}
+				if curr_data["type"] in ("state_change", "goal"):
+					curr_dir = parent_dir_sep + "time_{:04d}_{}".format(i, curr_data["type"])
+					curr_data["problem_path"] = curr_dir + os.sep + "problem.pddl"
+					curr_data["knowledge_path"] = curr_dir + os.sep + "knowledge.yaml"
+				self.time_steps.append(curr_data)
+			self.num_time_steps = len(self.time_steps)
+			self.curr_time_step = -1
+			return
+
+		time_steps = sorted(entry.name for entry in os.scandir(parent_dir) if entry.name.startswith("time_"))
+
+		self.num_time_steps = len(time_steps)
+
+		# the per-step reads are independent, so submit them all to a thread
+		# pool and fill in the results afterwards instead of serializing the
+		# syscall latency of every file
+		with ThreadPoolExecutor(max_workers=32) as executor:
+			pending: list[tuple[dict[str, Any], str, Future[str]]] = []
+			def read(curr_data: dict[str, Any], key: str, path: str) -> None:
+				pending.append((curr_data, key, executor.submit(_read_file, path)))
+
+			for i, time_step in enumerate(time_steps):
+				curr_dir = parent_dir_sep + time_step
+				curr_data: dict[str, Any] = {"time" : i}
+				if time_step.endswith("query"):
+					curr_data["type"] = "query"
+					read(curr_data, "query", curr_dir + os.sep + "query.txt")
+					read(curr_data, "answer", curr_dir + os.sep + "answer.txt")
+				elif time_step.endswith("state_change"):
+					curr_data["type"] = "state_change"
+					read(curr_data, "state_change", curr_dir + os.sep + "state_change.txt")
+					curr_data["problem_path"] = curr_dir + os.sep + "problem.pddl"
+					read(curr_data, "problem_pddl", curr_data["problem_path"])
+					curr_data["knowledge_path"] = curr_dir + os.sep + "knowledge.yaml"
+					read(curr_data, "knowledge_yaml", curr_data["knowledge_path"])
+				elif time_step.endswith("goal"):
+					curr_data["type"] = "goal"
+					read(curr_data, "goal", curr_dir + os.sep + "goal.txt")
+					curr_data["problem_path"] = curr_dir + os.sep + "problem.pddl"
+					read(curr_data, "problem_pddl", curr_data["problem_path"])
+					curr_data["knowledge_path"] = curr_dir + os.sep + "knowledge.yaml"
+					read(curr_data, "knowledge_yaml", curr_data["knowledge_path"])
+				else:
+					raise Exception("Invalid dataset directory:", time_step)
+				self.time_steps.append(curr_data)
+			for curr_data, key, future in pending:
+				curr_data[key] = future.result()
 		
 		self.curr_time_step = -1
 	
@@ -2100,26 +2278,40 @@ class Dataset:
 		return self.time_steps[self.curr_time_step]
 
 T = TypeVar('T')
+@lru_cache(maxsize=None)
 def get_concrete_subtypes(initial_type: type[T]) -> list[type[T]]:
-	found_types: list[type] = [initial_type]
-	concrete_subtypes: set[type] = set()
-	while len(found_types) > 0:
-		curr_type = found_types.pop()
+	seen: set[type] = {initial_type}
+	stack: list[type] = [initial_type]
+	concrete_subtypes: list[type] = []
+	while stack:
+		curr_type = stack.pop()
 		if not isabstract(curr_type):
-			concrete_subtypes.add(curr_type)
-		found_types.extend(curr_type.__subclasses__())
-	return list(concrete_subtypes)
-
-item_types = get_concrete_subtypes(RoomItem)
-movable_types = get_concrete_subtypes(MovableItem)
-creatable_movable_types = [movable_type for movable_type in movable_types if not issubclass(movable_type, AccompanyingItem)]
-stationary_types = get_concrete_subtypes(StationaryItem)
-room_types = get_concrete_subtypes(Room)
-collective_goal_types = get_concrete_subtypes(CollectiveGoal)
-
+			concrete_subtypes.append(curr_type)
+		for subtype in curr_type.__subclasses__():
+			if subtype not in seen:
+				seen.add(subtype)
+				stack.append(subtype)
+	return concrete_subtypes
+
+creatable_movable_types: list[type[MovableItem]]
 static_entities: list[Instance] = []
-for item_type in item_types:
-	static_entities += item_type.get_static_entities()
+_static_pddl_objects: list[str] = []
+_types_ready = False
+
+def _ensure_types() -> None:
+	global _types_ready, item_types, movable_types, creatable_movable_types, stationary_types, room_types, collective_goal_types
+	if _types_ready:
+		return
+	_types_ready = True
+	item_types = get_concrete_subtypes(RoomItem)
+	movable_types = get_concrete_subtypes(MovableItem)
+	creatable_movable_types = [movable_type for movable_type in movable_types if not issubclass(movable_type, AccompanyingItem)]
+	stationary_types = get_concrete_subtypes(StationaryItem)
+	room_types = get_concrete_subtypes(Room)
+	collective_goal_types = get_concrete_subtypes(CollectiveGoal)
+	for item_type in item_types:
+		static_entities.extend(item_type.get_static_entities())
+	_static_pddl_objects.extend(f"{entity.entity_id.name} - {entity.entity_id.concept}" for entity in static_entities)
 
 if __name__ == "__main__":
 	generator = DatasetGenerator("test", num_state_changes=1, state_changes_per_query=300, state_changes_per_goal=1)
@@ -1,11 +1,23 @@
+import ast
+import re
 from typing import Any, Dict, List, Optional
 from llama_index.core.graph_stores.types import GraphStore
 
 try:
     import psycopg2
+    from psycopg2.extras import execute_batch
 except ImportError:
     raise ImportError("Please install psycopg2")
 
+_AGTYPE_SUFFIX_RE = re.compile(r"::\w+$")
+
+def _parse_agtype(value: str) -> Any:
+    """Parse an agtype cell (a quoted string or a nested list) without eval()."""
+    value = _AGTYPE_SUFFIX_RE.sub("", value)
+    if value.startswith('"') and value.endswith('"') and "\\" not in value:
+        return value[1:-1]
+    return ast.literal_eval(value)
+
 class AgeGraphStore(GraphStore): # type: ignore
     def __init__(
         self,
@@ -22,33 +34,39 @@ class AgeGraphStore(GraphStore): # type: ignore
             self._conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
             self._conn.autocommit = True
             cur = self._conn.cursor()
-            cur.execute(f"LOAD 'age'")
-            cur.execute(f"SET search_path = ag_catalog, '$user', public;")
+            cur.execute("LOAD 'age'")
+            cur.execute("SET search_path = ag_catalog, '$user', public;")
         except psycopg2.OperationalError as err:
             raise ValueError(err)
         self._dbname = dbname
         self._graph_name = graph_name
         self._node_label = node_label
+        # Graph name and labels are identifiers and cannot be bound as query
+        # parameters, so templates interpolate them once here; node names and
+        # other values are bound with %s at execute time.
+        self._get_query = (
+            f"SELECT * FROM ag_catalog.cypher('{graph_name}', $$ "
+            f"MATCH (:{node_label} {{name: %s}})-[r]->(n2:{node_label})"
+            f"RETURN type(r), n2.name"
+            f"$$) as (rel agtype, obj agtype);"
+        )
         cur.execute("SELECT entities.entity_id, attribute_value \"name\" FROM entities JOIN entity_attributes_str ON entities.entity_id = entity_attributes_str.entity_id WHERE attribute_name = 'name';")
         results = cur.fetchall()
         self.id_to_name = {row[0] : row[1] for row in results}
         self.name_to_id = {row[1] : row[0] for row in results}
+        self._cur = cur
 
     def cursor(self):
-        return self._conn.cursor()
+        # One cursor is shared for the store's lifetime; every method drains
+        # its results before the next execute, so per-call cursors are waste.
+        return self._cur
 
     def get(self, subj: str) -> List[List[str]]:
         """Get triplets."""
-        query = (
-                    f"SELECT * FROM ag_catalog.cypher('{self._graph_name}', $$ "
-                    f"MATCH (:{self._node_label} {{name:'{subj}'}})-[r]->(n2:{self._node_label})"
-                    f"RETURN type(r), n2.name"
-                    f"$$) as (rel agtype, obj agtype);"
-        )
         cur = self.cursor()
-        cur.execute(query)
+        cur.execute(self._get_query, (subj,))
         results = cur.fetchall()
-        return [[eval(rel), eval(obj)] for (rel, obj) in results]
+        return [[_parse_agtype(rel), _parse_agtype(obj)] for (rel, obj) in results]
 
     def get_rel_map(
             self, subjs: Optional[List[str]] = None, depth: int = 2, limit: int=30
@@ -62,115 +80,141 @@ class AgeGraphStore(GraphStore): # type: ignore
         
         subjs = [subj.replace('"', '') for subj in subjs]
 
+        seen: Dict[str, set] = {}
         for subj in subjs:
             rel_map[subj] = []
+            seen[subj] = set()
         
         # max 100 can be processed at a time by db
         for j in range(0, len(subjs), 100):
-            subjs_str = '["' + '", "'.join(subjs[j:j+100]) + '"]'
-
-            for i in range(depth):
-                path = f"-[]-(:{self._node_label})" * i
-
-                query = (f"SELECT * FROM ag_catalog.cypher('{self._graph_name}', $$ "
-                        f"MATCH p=(n1:{self._node_label}){path}-[]-() "
-                        f"WHERE n1.name IN {subjs_str} "
-                        f"WITH n1.name AS subj, p, relationships(p) AS rels "
-                        f"UNWIND rels AS rel "
-                        f"WITH subj AS subj, p, collect([startNode(rel).name, type(rel), endNode(rel).name]) AS predicates "
-                        f"RETURN subj, predicates LIMIT {limit}"
-                        f"$$) as (subj agtype, rel agtype);"
-                        )
-                cur = self.cursor()
-                try:
-                    cur.execute(query)
-                except psycopg2.errors.TooManyArguments as err:
-                    # should never happen
-                    print(err)
-                    print(query)
-                    print(subjs_str)
-                    raise err
-                except psycopg2.errors.SyntaxError as err:
-                    print(err)
-                    print(query)
-                    print(subjs_str)
-                results = cur.fetchall()
-                for row in results:
-                    for rel in eval(row[1]):
-                        rel_str = "" + rel[0] + ", -[" + rel[1] + "], " + "-> " + rel[2] + ""
-                        if rel_str not in rel_map[eval(row[0])]:
-                            rel_map[eval(row[0])].append(rel_str)
+            chunk = subjs[j:j+100]
+            subjs_list = "[" + ", ".join(["%s"] * len(chunk)) + "]"
+
+            query = (f"SELECT * FROM ag_catalog.cypher('{self._graph_name}', $$ "
+                    f"MATCH p=(n1:{self._node_label})-[*1..{depth}]-() "
+                    f"WHERE n1.name IN {subjs_list} "
+                    f"WITH n1.name AS subj, p, relationships(p) AS rels "
+                    f"UNWIND rels AS rel "
+                    f"WITH subj AS subj, p, collect([startNode(rel).name, type(rel), endNode(rel).name]) AS predicates "
+                    f"RETURN subj, predicates LIMIT {limit * depth}"
+                    f"$$) as (subj agtype, rel agtype);"
+                    )
+            cur = self.cursor()
+            try:
+                cur.execute(query, chunk)
+            except psycopg2.errors.TooManyArguments as err:
+                # should never happen
+                print(err)
+                print(query)
+                print(chunk)
+                raise err
+            except psycopg2.errors.SyntaxError as err:
+                print(err)
+                print(query)
+                print(chunk)
+            results = cur.fetchall()
+            for row in results:
+                subj = _parse_agtype(row[0])
+                subj_rels = rel_map[subj]
+                subj_seen = seen[subj]
+                for rel in _parse_agtype(row[1]):
+                    rel_str = f"{rel[0]}, -[{rel[1]}], -> {rel[2]}"
+                    if rel_str not in subj_seen:
+                        subj_seen.add(rel_str)
+                        subj_rels.append(rel_str)
 
         return rel_map
 
+    def _group_by_rel(self, triplets: List[tuple]) -> Dict[str, List[tuple]]:
+        """Group (subj, rel, obj) triplets by rel, since edge labels cannot be parameterized."""
+        by_rel: Dict[str, List[tuple]] = {}
+        for subj, rel, obj in triplets:
+            by_rel.setdefault(rel, []).append((subj, obj))
+        return by_rel
+
+    def upsert_triplets(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets, amortizing round trips across each page."""
+        cur = self.cursor()
+        for rel, pairs in self._group_by_rel(triplets).items():
+            execute_batch(
+                cur,
+                f"SELECT * FROM cypher('{self._graph_name}', "
+                f"$$MERGE (u:{self._node_label} {{name: %s}})"
+                f"MERGE (v:{self._node_label} {{name: %s}}) "
+                f"MERGE (u)-[e:{rel}]->(v) $$) as (e agtype);",
+                pairs, page_size=500)
+
+    def upsert_triplets_entity(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets with entity values."""
+        cur = self.cursor()
+        for rel, pairs in self._group_by_rel(triplets).items():
+            execute_batch(
+                cur,
+                f"SELECT * FROM cypher('{self._graph_name}', "
+                f"$$MERGE (a:{self._node_label} {{id: %s }}) "
+                f"RETURN a $$) as (a agtype);"
+                f"SELECT * FROM cypher('{self._graph_name}', "
+                f"$$MERGE (a:{self._node_label} {{id: %s }}) "
+                f"RETURN a $$) as (a agtype);"
+                f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: %s}}), "
+                f"(v:{self._node_label} {{id: %s}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);",
+                [(subj, obj, subj, obj) for subj, obj in pairs], page_size=500)
+
+    def _upsert_triplets_value(self, triplets: List[tuple], value_label: str) -> None:
+        """Add a batch of triplets whose objects are value nodes with the given label."""
+        cur = self.cursor()
+        for rel, pairs in self._group_by_rel(triplets).items():
+            execute_batch(
+                cur,
+                f"SELECT * FROM cypher('{self._graph_name}', "
+                f"$$MERGE (a:{value_label} {{name: %s }}) "
+                f"RETURN a $$) as (a agtype);"
+                f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: %s}}), "
+                f"(v:{value_label} {{name: %s}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);",
+                [(obj, subj, obj) for subj, obj in pairs], page_size=500)
+
+    def upsert_triplets_bool(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets with bool values."""
+        self._upsert_triplets_value(
+            [(subj, rel, str(obj).lower()) for subj, rel, obj in triplets], "bool")
+
+    def upsert_triplets_float(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets with float values."""
+        self._upsert_triplets_value(
+            [(subj, rel, str(obj)) for subj, rel, obj in triplets], "float")
+
+    def upsert_triplets_int(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets with int values."""
+        self._upsert_triplets_value(
+            [(subj, rel, str(obj)) for subj, rel, obj in triplets], "int")
+
+    def upsert_triplets_str(self, triplets: List[tuple]) -> None:
+        """Add a batch of triplets with string values."""
+        self._upsert_triplets_value(triplets, "str")
+
     def upsert_triplet(self, subj: str, rel: str, obj: str) -> None:
         """Add triplet."""
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (u:{self._node_label} {{name: '{subj}'}})"
-            f"MERGE (v:{self._node_label} {{name: '{obj}'}}) "
-            f"MERGE (u)-[e:{rel}]->(v) $$) as (e agtype);")
+        self.upsert_triplets([(subj, rel, obj)])
 
     def upsert_triplet_entity(self, subj: str, rel: str, obj: str) -> None:
         """Add triplet with entity value."""
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:{self._node_label} {{id: '{subj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:{self._node_label} {{id: '{obj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: '{subj}'}}), "
-            f"(v:{self._node_label} {{id: '{obj}'}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);")
+        self.upsert_triplets_entity([(subj, rel, obj)])
 
     def upsert_triplet_bool(self, subj: str, rel: str, obj_bool: bool) -> None:
         """Add triplet with bool value."""
-        obj = str(obj_bool).lower()
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:bool {{name: '{obj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: '{subj}'}}), "
-            f"(v:bool {{name: '{obj}'}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);")
+        self.upsert_triplets_bool([(subj, rel, obj_bool)])
 
     def upsert_triplet_float(self, subj: str, rel: str, obj: float) -> None:
         """Add triplet with float value."""
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:float {{name: '{obj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: '{subj}'}}), "
-            f"(v:float {{name: '{obj}'}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);")
-    
+        self.upsert_triplets_float([(subj, rel, obj)])
+
     def upsert_triplet_int(self, subj: str, rel: str, obj: int) -> None:
         """Add triplet with int value."""
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:int {{name: '{obj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: '{subj}'}}), "
-            f"(v:int {{name: '{obj}'}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);")
+        self.upsert_triplets_int([(subj, rel, obj)])
 
     def upsert_triplet_str(self, subj: str, rel: str, obj: str) -> None:
         """Add triplet with string value."""
-        cur = self.cursor()
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MERGE (a:str {{name: '{obj}' }}) "
-            f"RETURN a $$) as (a agtype);")
-        cur.execute(
-            f"SELECT * FROM cypher('{self._graph_name}', $$MATCH (u:{self._node_label} {{id: '{subj}'}}), "
-            f"(v:str {{name: '{obj}'}}) CREATE (u)-[e:{rel}]->(v) RETURN e$$) as (e agtype);")
+        self.upsert_triplets_str([(subj, rel, obj)])
 
     def delete(self, subj: str, rel: str, obj: str) -> None:
         """Delete triplet."""
@@ -179,20 +223,21 @@ class AgeGraphStore(GraphStore): # type: ignore
         def check_edges(entity: str) -> bool:
             cur.execute(
                 f"SELECT * FROM cypher('{self._graph_name}', "
-                f"$$MATCH (u {{name: '{entity}'}})-[]-(v) "
-                f"RETURN v $$) as (v agtype);")
+                f"$$MATCH (u {{name: %s}})-[]-(v) "
+                f"RETURN v $$) as (v agtype);", (entity,))
             results = cur.fetchall()
             return bool(len(results))
 
         def delete_entity(entity: str) -> None:
             cur.execute(
                 f"SELECT * FROM cypher('{self._graph_name}', "
-                f"$$MATCH (u {{name: '{entity}'}}) DELETE u$$) as (u agtype);")
+                f"$$MATCH (u {{name: %s}}) DELETE u$$) as (u agtype);", (entity,))
 
         def delete_rel(subj: str, obj: str, rel: str) -> None:
             cur.execute(
                 f"SELECT * FROM cypher('{self._graph_name}', "
-                f"$$MATCH (u {{name: '{subj}'}})-[e:{rel}]->(v {{name: '{obj}'}}) DELETE e$$) as (e agtype);")
+                f"$$MATCH (u {{name: %s}})-[e:{rel}]->(v {{name: %s}}) DELETE e$$) as (e agtype);",
+                (subj, obj))
 
         delete_rel(subj, obj, rel)
         # if not check_edges(subj):
@@ -205,14 +250,16 @@ class AgeGraphStore(GraphStore): # type: ignore
         cur = self.cursor()
         cur.execute(
             f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MATCH (u:{self._node_label} {{name: '{subj}'}})-[e:{rel}]->() DELETE e$$) as (e agtype);")
+            f"$$MATCH (u:{self._node_label} {{name: %s}})-[e:{rel}]->() DELETE e$$) as (e agtype);",
+            (subj,))
 
     def delete_rel_with_obj(self, rel: str, obj: str) -> None:
         """Delete triplet with obj and rel."""
         cur = self.cursor()
         cur.execute(
             f"SELECT * FROM cypher('{self._graph_name}', "
-            f"$$MATCH (u)-[e:{rel}]->(v:{self._node_label} {{name: '{obj}'}}) DELETE e$$) as (e agtype);")
+            f"$$MATCH (u)-[e:{rel}]->(v:{self._node_label} {{name: %s}}) DELETE e$$) as (e agtype);",
+            (obj,))
 
     def query(self, query: str, param_map: Optional[Dict[str, Any]] = {}, return_count: int = 1) -> Any:
         cur = self.cursor()